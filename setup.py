@@ -87,6 +87,8 @@ setup(
         'build': build_requires,
         'publish': publish_requires,
         'dev': build_requires,
+        'ijson': ['ijson'],
+        'watch': ['watchdog'],
     },
     platforms='any',
     entry_points={
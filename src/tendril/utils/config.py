@@ -29,34 +29,185 @@ TODO Describe Architecture and Usage somewhere
 """
 
 import os
+import sys
 import json
+import marshal
+import hashlib
+import copy
+import builtins
+import tempfile
 import importlib
+import importlib.util
+import threading
+from collections import deque
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from runpy import run_path
-from distutils.util import strtobool
-from tendril.utils.versions import get_namespace_package_names
+from tendril.utils.versions import get_cached_namespace_package_names
+from tendril.utils.versions import FeatureUnavailable
 from tendril.utils.files import yml
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
 
-def is_jsonable(x):
+#: Stands in for the key of array elements in streamed key paths. It
+#: never equals a key from a keymap.
+_ARRAY_ITEM = object()
+
+#: Read buffer size used when parsing external config files.
+_READ_BUFFER_SIZE = 1 << 20
+
+#: Values extracted from external JSON config files, keyed by the path of
+#: the file and the key_paths extracted from it. Each entry holds the
+#: (mtime, size) of the file it was extracted from. The values are shared
+#: by every source reading the same file, and are copied on the way out.
+_EXTERNAL_JSON_CACHE = {}
+
+
+def _config_cache_dir():
+    cache_root = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_root, 'tendril', 'configcache')
+
+
+def _is_private(st):
+    """Whether the file or directory described by the stat result ``st`` is
+    owned by the current user and not writable by anyone else."""
+    if not hasattr(os, 'getuid'):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _read_config_cache(cache_path, header):
+    try:
+        if not _is_private(os.stat(os.path.dirname(cache_path))):
+            return None
+        with open(cache_path, 'rb') as f:
+            if not _is_private(os.fstat(f.fileno())):
+                return None
+            if f.read(len(header)) == header:
+                return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    return None
+
+
+def _write_config_cache(cache_path, header, code):
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        if not _is_private(os.stat(cache_dir)):
+            logger.warning("Not writing config cache to %s, which is not "
+                           "private to the current user", cache_dir)
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header)
+                marshal.dump(code, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug("Could not write config cache %s : %s", cache_path, e)
+
+
+def _exec_config(path, cache=False):
+    """Execute a python config file and return its namespace as a dict.
+
+    This replaces :func:`runpy.run_path` for the instance and local config
+    files. If ``cache`` is set, the compiled code object is cached on disk
+    under ``$XDG_CACHE_HOME/tendril/configcache``, keyed on the
+    interpreter's bytecode magic number and a hash of the file's contents,
+    so unchanged config files are not re-parsed on every start, while any
+    edit to them is, whatever happens to their mtime.
+
+    The cached code includes every literal in the config file, including
+    any credentials, and outlives changes to or removal of the file
+    itself. The cache files are only readable by the current user, and
+    cache files or directories not private to the current user are
+    ignored.
+    """
+    with open(path, 'rb') as f:
+        source = f.read()
+
+    if cache:
+        header = importlib.util.MAGIC_NUMBER + \
+            importlib.util.source_hash(source)
+        key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+        cache_path = os.path.join(_config_cache_dir(), key + '.pyc')
+        code = _read_config_cache(cache_path, header)
+        if code is None:
+            code = compile(source, path, 'exec')
+            _write_config_cache(cache_path, header, code)
+    else:
+        code = compile(source, path, 'exec')
+
+    namespace = {'__name__': '<run_path>', '__file__': path,
+                 '__builtins__': builtins}
+    exec(code, namespace)
+    return namespace
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_jsonable(x):
+    if isinstance(x, _JSON_SCALARS):
+        return True
+    if isinstance(x, (list, tuple)):
+        return all(_is_jsonable(i) for i in x)
+    if isinstance(x, dict):
+        return all(isinstance(k, _JSON_SCALARS) and _is_jsonable(v)
+                   for k, v in x.items())
+    return _dumps_jsonable(x)
+
+
+def _dumps_jsonable(x):
     try:
         json.dumps(x)
         return True
-    except:
+    except (TypeError, ValueError, OverflowError, RecursionError):
         return False
 
 
+def is_jsonable(x):
+    try:
+        return _is_jsonable(x)
+    except RecursionError:
+        # Self-referencing containers, which json rejects as circular, or
+        # nesting too deep for json to encode either.
+        return _dumps_jsonable(x)
+
+
 class ConfigElement(object):
     def __init__(self, name, default, doc, parser=None, masked=False):
-        self.name = name
+        self.name = sys.intern(name)
         self.default = default
         self.doc = doc
         self.parser = parser
         self.masked = masked
         self.source = None
         self.ctx = None
+        self._code = None
+        self._cached = None
+
+    @property
+    def _default_code(self):
+        # Compiled on first use rather than in __init__, so that a default
+        # which is not a valid expression only fails if it is actually
+        # needed.
+        if self._code is None:
+            self._code = compile(self.default,
+                                 '<config {0}>'.format(self.name), 'eval')
+        return self._code
 
     def doc_render(self):
         return [self.name, self.doc, self.default,
@@ -66,6 +217,17 @@ class ConfigElement(object):
     def value(self):
         raise NotImplementedError
 
+    def freeze(self):
+        """Resolve and retain the value of the element, if the element
+        type supports it. This is called by the :class:`ConfigManager`
+        when the element is loaded.
+        """
+        pass
+
+    def invalidate(self):
+        """Discard any value retained by :meth:`freeze`."""
+        pass
+
     @property
     def masked_value(self):
         """Return a masked version of the value of the option.
@@ -83,7 +245,9 @@ class ConfigElement(object):
         Returns:
             str: The masked value of the field.
         """
-        value = self.value
+        return self._mask(self.value)
+
+    def _mask(self, value):
         if not self.masked:
             return value
         if not isinstance(value, str):
@@ -91,21 +255,33 @@ class ConfigElement(object):
 
         v_len = len(value)
         m_len = int(min(v_len/8, 8))
+        if not m_len:
+            return "..."
         return f"{value[:m_len]}...{value[-m_len:]}"
 
     @property
     def jsonable_value(self):
-        if is_jsonable(self.masked_value):
-            return self.masked_value
+        masked_value = self.masked_value
+        if is_jsonable(masked_value):
+            return masked_value
         else:
-            return str(self.masked_value)
+            return str(masked_value)
+
+
+_TRUE_STRINGS = frozenset(('y', 'yes', 't', 'true', 'on', '1'))
+_FALSE_STRINGS = frozenset(('n', 'no', 'f', 'false', 'off', '0'))
 
 
 def bool_parser(value):
     if not value:
         return False
     if isinstance(value, str):
-        return strtobool(value)
+        v = value.strip().lower()
+        if v in _TRUE_STRINGS:
+            return True
+        if v in _FALSE_STRINGS:
+            return False
+        raise ValueError("Invalid truth value {0!r}".format(value))
     else:
         return bool(value)
 
@@ -116,12 +292,23 @@ class ConfigConstant(ConfigElement):
     configuration module and cannot be changed by the user or the instance
     administrator without modifying the code.
 
-    The value itself is constructed using ``eval()``.
+    The value itself is constructed using ``eval()``, once per context.
+    The default may instead be a callable, in which case it is called
+    with the context and its return value is used.
     """
     @property
     def value(self):
         self.source = "hardcoded"
-        return eval(self.default, self.ctx)
+        if self._cached is None or self._cached[0] != id(self.ctx):
+            if callable(self.default):
+                value = self.default(self.ctx)
+            else:
+                value = eval(self._default_code, self.ctx)
+            self._cached = (id(self.ctx), value)
+        return self._cached[1]
+
+    def invalidate(self):
+        self._cached = None
 
 
 class ConfigOption(ConfigElement):
@@ -134,45 +321,67 @@ class ConfigOption(ConfigElement):
     the actual configuration value and not an expression. The
     default value specified here is used through ``eval()``.
 
+    Once loaded, the resolved value is frozen, since none of the
+    sources it can be drawn from change after the config files are
+    loaded. Use :meth:`invalidate` to force it to be resolved again.
+
     """
+    def __init__(self, name, default, doc, parser=None, masked=False):
+        super(ConfigOption, self).__init__(name, default, doc,
+                                           parser=parser, masked=masked)
+        self._frozen = _MISSING
+        self._masked = _MISSING
+
+    def freeze(self):
+        self.invalidate()
+        self._frozen = self.value
+        self._masked = self._mask(self._frozen)
+
+    def invalidate(self):
+        self._frozen = _MISSING
+        self._masked = _MISSING
+
+    @property
+    def masked_value(self):
+        if self._masked is not _MISSING:
+            return self._masked
+        return super(ConfigOption, self).masked_value
+
     @property
     def raw_value(self):
-        try:
-            rv = self.ctx['_environment_overrides'][self.name]
+        rv = self.ctx['_environment_overrides'].get(self.name, _MISSING)
+        if rv is not _MISSING:
             self.source = 'environment_override'
             return rv
-        except KeyError:
-            pass
 
-        try:
-            rv = self.ctx['_local_config'][self.name]
+        rv = self.ctx['_local_config'].get(self.name, _MISSING)
+        if rv is not _MISSING:
             self.source = 'local_override'
             return rv
-        except KeyError:
-            pass
 
-        try:
-            rv = self.ctx['_instance_config'][self.name]
+        rv = self.ctx['_instance_config'].get(self.name, _MISSING)
+        if rv is not _MISSING:
             self.source = 'instance_config'
             return rv
-        except KeyError:
-            pass
 
-        try:
-            if self.ctx['_external_configs']:
-                rv = self.ctx['_external_configs'].get(self.name)
+        external_configs = self.ctx['_external_configs']
+        if external_configs:
+            try:
+                rv = external_configs.get(self.name)
                 self.source = 'external_config'
                 return rv
-        except ExternalConfigKeyError:
-            pass
+            except ExternalConfigKeyError:
+                pass
 
         try:
-            rv = eval(self.default, self.ctx)
+            rv = eval(self._default_code, self.ctx)
             self.source = 'default'
             return rv
-        except SyntaxError:
-            print("Required config option not set in "
-                  "instance config : " + self.name)
+        except (SyntaxError, NameError, TypeError):
+            # Options which must be provided by the instance are given
+            # defaults which cannot be compiled or evaluated.
+            logger.error("Required config option not set in "
+                         "instance config : %s", self.name)
             raise
 
     @property
@@ -185,6 +394,8 @@ class ConfigOption(ConfigElement):
 
         (doc generated mostly by GitHub Copilot)
         """
+        if self._frozen is not _MISSING:
+            return self._frozen
         if self.parser:
             if self.parser == bool:
                 return bool_parser(self.raw_value)
@@ -231,6 +442,14 @@ class ConfigSourceDoesNotContainKey(ExternalConfigKeyError):
         self.key_path = key_path
 
 
+class InstanceRootNotFoundError(Exception):
+    def __init__(self, candidates):
+        super(InstanceRootNotFoundError, self).__init__(
+            "No instance root found. Looked in : {}".format(
+                ', '.join(candidates)))
+        self.candidates = candidates
+
+
 class ConfigSourceBase(object):
     def get(self, key):
         raise NotImplementedError
@@ -239,58 +458,168 @@ class ConfigSourceBase(object):
 class ConfigExternalSource(ConfigSourceBase):
     def __init__(self, path, keymap):
         self._path = path
-        self._keymap: dict = keymap
+        self._expanded_path = os.path.expandvars(path)
+        self._keymap: dict = {sys.intern(key): key_path
+                              for key, key_path in keymap.items()}
+        self._paths = {key: tuple(key_path.split(':'))
+                       for key, key_path in self._keymap.items()}
 
     @property
     def path(self):
         return self._path
 
+    def keys(self):
+        return self._keymap.keys()
+
     def get(self, key):
-        if key not in self._keymap.keys():
+        key_path = self._paths.get(key)
+        if key_path is None:
             raise ConfigSourceDoesNotProvideKey(self._path, key)
-        return self._get(self._keymap[key])
+        return self._get(key_path)
 
     def _get(self, key_path):
         raise NotImplementedError
 
 
 class ConfigExternalJSONSource(ConfigExternalSource):
-    def __init__(self, path, keymap):
+    def __init__(self, path, keymap, stream=False):
         super(ConfigExternalJSONSource, self).__init__(path, keymap)
-        self._source = None
-        self._load_external_config()
+        if stream and ijson is None:
+            raise FeatureUnavailable('Streaming JSON Config', 'ijson')
+        self._stream = stream
+        self._flat = None
 
     def _load_external_config(self):
         """
-        This function loads the external config file into a dictionary
+        This function loads the values of the mapped keys from the
+        external config file into a flat dictionary, keyed by the
+        key_path tuple.
 
         The external config file is a json file that contains some
-        configuration parameters for the application.
+        configuration parameters for the application. By default, the
+        whole file is loaded with :func:`json.load` and the referenced
+        values are extracted from it. If the source was created with
+        ``stream=True`` (``stream: true`` in the external configs file),
+        the file is instead parsed as a stream using ``ijson`` and only
+        the values actually referenced by the keymap are retained.
+
+        The two parsers differ for documents with duplicate keys. The
+        json module keeps only the last occurrence of a key, while the
+        stream parser sees every occurrence and retains the last value
+        found at each mapped path. For ``{"a": {"b": 1}, "a": {"c": 2}}``,
+        ``a:b`` is missing when loaded with json but is 1 when streamed.
+
+        This is called on the first lookup against the source rather
+        than at construction, so that files for sources which are never
+        needed are not read at all. A missing file raises
+        ExternalConfigMissingError on that first lookup, and behaves as
+        an empty source thereafter.
+
+        The extracted values are cached across sources and managers for
+        as long as the file's mtime and size remain unchanged.
 
         (doc generated mostly by GitHub Copilot)
         """
-        if not os.path.exists(os.path.expandvars(self._path)):
+        try:
+            st = os.stat(self._expanded_path)
+        except FileNotFoundError:
+            self._flat = {}
             raise ExternalConfigMissingError(self._path, 'json')
-        with open(os.path.expandvars(self._path), 'r') as f:
-            self._source = json.load(f)
+
+        cache_key = (os.path.abspath(self._expanded_path),
+                     frozenset(self._paths.values()), self._stream)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _EXTERNAL_JSON_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            self._flat = cached[1]
+            return
+
+        with open(self._expanded_path, 'rb',
+                  buffering=_READ_BUFFER_SIZE) as f:
+            if self._stream:
+                self._flat = self._extract_stream(f)
+            else:
+                self._flat = self._extract(json.load(f))
+        _EXTERNAL_JSON_CACHE[cache_key] = (stamp, self._flat)
+
+    def _extract(self, source):
+        flat = {}
+        for key_path in set(self._paths.values()):
+            rval = source
+            try:
+                for crumb in key_path:
+                    rval = rval[crumb]
+            except (KeyError, IndexError, TypeError):
+                continue
+            flat[key_path] = rval
+        return flat
+
+    def _extract_stream(self, f):
+        # The key path is tracked as a tuple from the map_key events, since
+        # ijson's '.' separated prefixes are ambiguous for keys containing
+        # '.' and for the 'item' segment standing in for array elements.
+        # As with json.load, nothing inside an array is addressable.
+        wanted = set(self._paths.values())
+        flat = {}
+        builders = []
+        path = []
+        for event, value in ijson.basic_parse(f, buf_size=_READ_BUFFER_SIZE,
+                                              use_float=True):
+            for _, _, builder in builders:
+                builder.event(event, value)
+            if event == 'map_key':
+                path[-1] = value
+                continue
+            if event in ('end_map', 'end_array'):
+                path.pop()
+                if builders and builders[-1][1] == len(path):
+                    key_path, _, builder = builders.pop()
+                    flat[key_path] = builder.value
+                continue
+            key_path = tuple(path)
+            if event == 'start_map':
+                path.append(None)
+            elif event == 'start_array':
+                path.append(_ARRAY_ITEM)
+            elif key_path in wanted:
+                flat[key_path] = value
+                continue
+            else:
+                continue
+            if key_path in wanted:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                builders.append((key_path, len(path) - 1, builder))
+        return flat
 
     def _get(self, key_path):
         """Return the value at the end of the key_path.
 
-        key_path is a string of the form 'key1:key2:key3' where each key
-        is a key in a dict. This function will return the value of key3
-        in the dict d[key1][key2]. If key1, key2, or key3 do not exist,
-        a ConfigSourceDoesNotContainKey error will be raised.
+        key_path is a tuple of the form ('key1', 'key2', 'key3'), as
+        split from the 'key1:key2:key3' form used in the keymap, where
+        each key is a key in a dict. This function will return the value
+        of key3 in the dict d[key1][key2]. If key1, key2, or key3 do not
+        exist, a ConfigSourceDoesNotContainKey error will be raised.
 
         (doc generated mostly by GitHub Copilot)
         """
-        rval = self._source
+        if self._flat is None:
+            self._load_external_config()
         try:
-            for crumb in key_path.split(':'):
-                rval = rval.get(crumb)
+            value = self._flat[key_path]
         except KeyError:
-            raise ConfigSourceDoesNotContainKey(self._source, None, key_path)
-        return rval
+            raise ConfigSourceDoesNotContainKey(self._path, None,
+                                                ':'.join(key_path))
+        if isinstance(value, (dict, list)):
+            # The extracted values are shared through _EXTERNAL_JSON_CACHE
+            value = copy.deepcopy(value)
+        return value
+
+
+#: External config source implementations, by the ``format`` they handle.
+_SOURCE_TYPES = {
+    'json': ConfigExternalJSONSource,
+}
 
 
 class ConfigExternalSources(ConfigSourceBase):
@@ -298,37 +627,43 @@ class ConfigExternalSources(ConfigSourceBase):
         super(ConfigExternalSources, self).__init__()
         self._path = path
         self._sources = []
+        self._key_sources = defaultdict(list)
         self._load_external_sources()
 
     def _load_external_sources(self):
         """
         This method loads the external config files from the given path.
         It iterates over each config and determines the format of the file.
-        If the format is JSON, it will create a ConfigExternalJSONSource object
-        and add it to the list of sources. If the file format is not supported,
-        it will raise an ExternalConfigFormatError.
+        It will create a source object of the type registered for that
+        format in _SOURCE_TYPES (ConfigExternalJSONSource for JSON) and add
+        it to the list of sources. Any keys of the config other than
+        format, path and keymap are passed to the source as keyword
+        arguments. If the file format is not supported, it will raise an
+        ExternalConfigFormatError.
 
         (doc generated mostly by GitHub Copilot)
         """
         external_configs = yml.load(self._path)
         for config in external_configs:
-            try:
-                if config['format'] == 'json':
-                    self._sources.append(
-                        ConfigExternalJSONSource(config['path'], config['keymap'])
-                    )
-                else:
-                    raise ExternalConfigFormatError(config['path'], config['filetype'])
-            except ExternalConfigMissingError:
-                pass
+            source_type = _SOURCE_TYPES.get(config['format'])
+            if source_type is None:
+                raise ExternalConfigFormatError(config['path'],
+                                                config['format'])
+            options = {k: v for k, v in config.items()
+                       if k not in ('format', 'path', 'keymap')}
+            source = source_type(config['path'], config['keymap'], **options)
+            self._sources.append(source)
+            for key in source.keys():
+                self._key_sources[key].append(source)
 
     def get(self, key):
         """Return the value associated with the key in the configured 
         external sources.
 
         Returns the value associated with the key in the first source
-        that has the key. If the key is not found in any of the sources,
-        raise ExternalConfigKeyError.
+        that has the key. Sources whose files do not exist are skipped.
+        If the key is not found in any of the sources, raise
+        ExternalConfigKeyError.
 
         (doc generated mostly by GitHub Copilot)
 
@@ -342,24 +677,76 @@ class ConfigExternalSources(ConfigSourceBase):
             ExternalConfigKeyError: If the key is not found in any of
                 the sources.
         """
-        for source in self._sources:
+        for source in self._key_sources.get(key, ()):
             try:
                 return source.get(key)
-            except ExternalConfigKeyError:
+            except (ExternalConfigKeyError, ExternalConfigMissingError):
                 continue
         raise ExternalConfigKeyError(self._path, key)
 
 
+class _ConfigFileWatchHandler(object):
+    """watchdog event handler which calls ``callback`` once the watched
+    files have stopped changing for ``debounce`` seconds."""
+    _event_types = ('created', 'modified', 'moved', 'deleted')
+
+    def __init__(self, paths, callback, debounce):
+        self._paths = set(os.path.abspath(x) for x in paths)
+        self._callback = callback
+        self._debounce = debounce
+        self._timer = None
+        self._lock = threading.Lock()
+
+    @property
+    def directories(self):
+        return set(os.path.dirname(x) for x in self._paths)
+
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in self._event_types:
+            return
+        paths = {os.path.abspath(event.src_path)}
+        if getattr(event, 'dest_path', None):
+            paths.add(os.path.abspath(event.dest_path))
+        if not paths & self._paths:
+            return
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._debounce, self._callback)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+
 class ConfigManager(object):
     """The ConfigManager class provides a consistent interface for accessing
     configuration information from a variety of sources. It is intended to be
     a singleton.
 
+    If ``import_workers`` is greater than 1, the config modules are imported
+    concurrently on that many threads before they are loaded. Their module
+    bodies will then run concurrently, so this should only be enabled if
+    every config module is safe to import in parallel. The modules are
+    always loaded serially, in dependency order.
+
+    If ``cache_config_code`` is set, the compiled code of the instance and
+    local config files is cached on disk between runs. See
+    :func:`_exec_config` for what that entails for credentials held in
+    those files.
+
     (doc generated mostly by GitHub Copilot)
     """
-    def __init__(self, prefix, legacy, excluded, appname=None):
+    def __init__(self, prefix, legacy, excluded, appname=None,
+                 import_workers=None, cache_config_code=False):
         self._prefix = prefix
         self._excluded = excluded
+        self._import_workers = import_workers
+        self._cache_config_code = cache_config_code
         self.APPNAME = appname
 
         self._instance_config = None
@@ -367,22 +754,27 @@ class ConfigManager(object):
         self._external_configs: ConfigExternalSources = None
         self._environment_overrides = None
         self._modules_loaded = []
+        self._modules_loaded_set = set()
         self._legacy = None
         self._docs = []
+        self._rendered = None
+        self._sections = []
+        self._reload_lock = threading.RLock()
+        self._watch_handler = None
+        self._observer = None
+
+        # Config element defaults are evaluated against the manager's own
+        # namespace, so that they can refer to previously loaded elements.
+        self._eval_ctx = self.__dict__
+        self._eval_ctx['os'] = os
 
         self._load_legacy(legacy)
         self._load_configs()
 
-    def _check_depends(self, depends):
-        for m in depends:
-            if m not in self._modules_loaded:
-                return False
-        return True
-
     def _load_legacy(self, m_name):
         if not m_name:
             return
-        logger.debug("Loading legacy configuration from {0}".format(m_name))
+        logger.debug("Loading legacy configuration from %s", m_name)
         self._legacy = importlib.import_module(m_name)
 
     @property
@@ -394,37 +786,54 @@ class ConfigManager(object):
 
         This method will load configuration elements from modules in the 
         current namespace. It will respect the dependency order specified 
-        in the depends attribute of each module while loading. If any 
-        dependencies are not satisfied, the module will be skipped until 
-        it is. If a module is skipped and there are no remaining modules
-        to load, an error will be logged.
+        in the depends attribute of each module while loading, using a
+        topological sort over the declared dependencies. Modules whose
+        dependencies cannot be satisfied (missing, excluded, or cyclic)
+        are not loaded, and an error will be logged for each.
 
         (doc generated mostly by GitHub Copilot)
         """
-        logger.debug("Loading configuration from {0}".format(self._prefix))
-        modules = list(get_namespace_package_names(self._prefix))
-        changed = True
-        deadlocked = False
-        while len(modules) and not deadlocked:
-            if not changed:
-                deadlocked = True
-            changed = False
-            remaining_modules = []
-            for m_name in modules:
-                if m_name in self._excluded:
-                     continue
-                m = importlib.import_module(m_name)
-                if self._check_depends(m.depends):
-                    logger.debug("Loading {0}".format(m_name))
-                    m.load(self)
-                    self._modules_loaded.append(m_name)
-                    changed = True
-                else:
-                    if deadlocked:
-                        logger.error("Failed loading {0}. Missing dependency."
-                                     "".format(m_name))
-                    remaining_modules.append(m_name)
-            modules = remaining_modules
+        logger.debug("Loading configuration from %s", self._prefix)
+        m_names = [m_name for m_name
+                   in get_cached_namespace_package_names(self._prefix)
+                   if m_name not in self._excluded]
+        workers = min(self._import_workers or 1, len(m_names))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                imported = list(executor.map(importlib.import_module, m_names))
+        else:
+            imported = [importlib.import_module(m_name) for m_name in m_names]
+        modules = dict(zip(m_names, imported))
+
+        # Kahn's algorithm over the declared dependencies. Each module is
+        # imported exactly once above, and loaded exactly once below.
+        indegree = {}
+        dependents = defaultdict(list)
+        for m_name, m in modules.items():
+            depends = set(m.depends)
+            indegree[m_name] = len(depends)
+            for d_name in depends:
+                dependents[d_name].append(m_name)
+
+        ready = deque(m_name for m_name, count in indegree.items()
+                      if not count)
+        while ready:
+            m_name = ready.popleft()
+            logger.debug("Loading %s", m_name)
+            modules[m_name].load(self)
+            self._modules_loaded.append(m_name)
+            self._modules_loaded_set.add(m_name)
+            for d_name in dependents[m_name]:
+                indegree[d_name] -= 1
+                if not indegree[d_name]:
+                    ready.append(d_name)
+
+        for m_name, count in indegree.items():
+            if count:
+                missing = set(modules[m_name].depends) - \
+                    self._modules_loaded_set
+                logger.error("Failed loading %s. Missing dependency : %s",
+                             m_name, ', '.join(sorted(missing)))
 
     def load_config_files(self):
         """ Loads the configuration from different sources to 
@@ -435,34 +844,123 @@ class ConfigManager(object):
         :return: None
         """
         if os.path.exists(self.INSTANCE_CONFIG_FILE):
-            logger.info("Loading Instance Config from {0}"
-                         "".format(self.INSTANCE_CONFIG_FILE))
-            self._instance_config = run_path(self.INSTANCE_CONFIG_FILE)
+            logger.info("Loading Instance Config from %s",
+                        self.INSTANCE_CONFIG_FILE)
+            self._instance_config = _exec_config(
+                self.INSTANCE_CONFIG_FILE, cache=self._cache_config_code)
         else:
             self._instance_config = {}
 
         if os.path.exists(self.LOCAL_CONFIG_FILE):
-            logger.info("Loading Local Config from {0}"
-                         "".format(self.LOCAL_CONFIG_FILE))
-            self._local_config = run_path(self.LOCAL_CONFIG_FILE)
+            logger.info("Loading Local Config from %s",
+                        self.LOCAL_CONFIG_FILE)
+            self._local_config = _exec_config(
+                self.LOCAL_CONFIG_FILE, cache=self._cache_config_code)
         else:
             self._local_config = {}
 
-        try:
-            self._environment_overrides = {}
-            if self.ALLOW_ENVIRONMENT_OVERRIDES:
-                if self.ENVIRONMENT_OVERRIDE_PREFIX:
-                    for key, value in os.environ.items():
-                        if key.startswith(self.ENVIRONMENT_OVERRIDE_PREFIX):
-                            logger.info("Environment Config Override : {} : {}".format(key, value))
-                            self._environment_overrides[key[len(self.ENVIRONMENT_OVERRIDE_PREFIX):]] = value
-        except KeyError:
-            pass
+        self._environment_overrides = {}
+        prefix = self.ENVIRONMENT_OVERRIDE_PREFIX
+        if self.ALLOW_ENVIRONMENT_OVERRIDES and prefix:
+            plen = len(prefix)
+            self._environment_overrides = {
+                sys.intern(key[plen:]): value
+                for key, value in os.environ.items()
+                if key.startswith(prefix)
+            }
+            if logger.isEnabledFor(logging.DEBUG):
+                for key, value in self._environment_overrides.items():
+                    logger.debug("Environment Config Override : %s%s : %s",
+                                 prefix, key, value)
 
         if os.path.exists(self.EXTERNAL_CONFIG_SOURCES):
-            logger.debug("Loading External Configuration Maps from {0}"
-                         "".format(self.EXTERNAL_CONFIG_SOURCES))
-            self._external_configs = ConfigExternalSources(self.EXTERNAL_CONFIG_SOURCES)
+            logger.debug("Loading External Configuration Maps from %s",
+                         self.EXTERNAL_CONFIG_SOURCES)
+            self._external_configs = ConfigExternalSources(
+                self.EXTERNAL_CONFIG_SOURCES)
+        else:
+            self._external_configs = None
+
+    def reload_config_files(self):
+        """Reload the configuration files and re-resolve the values of
+        all loaded constants and options against them, in the order in
+        which they were loaded.
+
+        Constants are re-evaluated as well, since they may be derived
+        from options which the config files change.
+
+        Options are replaced one at a time on this manager without any
+        coordination with code reading them. When called by a file watcher,
+        this runs on the watcher's timer thread, and a reader on another
+        thread may see a mix of old and new values while it is in progress.
+        Reloads themselves are serialised against each other.
+
+        :return: None
+        """
+        with self._reload_lock:
+            self.load_config_files()
+            docs = []
+            for elements, doc in self._sections:
+                _doc_part = []
+                for element in elements:
+                    element.invalidate()
+                    element.freeze()
+                    setattr(self, element.name, element.value)
+                    _doc_part.append(element.doc_render())
+                docs.append([_doc_part, doc])
+            self._docs = docs
+            self._rendered = None
+
+    def _reload_on_change(self):
+        logger.info("Config files changed, reloading")
+        try:
+            self.reload_config_files()
+        except Exception:
+            logger.exception("Failed to reload config files")
+
+    def start_watching(self, debounce=0.1):
+        """Start watching the instance config, local config, and external
+        config source files, and reload the configuration when any of
+        them change. Bursts of changes within ``debounce`` seconds of
+        each other result in a single reload.
+
+        This requires ``watchdog``, which uses inotify or FSEvents where
+        the platform provides them.
+
+        :return: None
+        """
+        if self._observer is not None:
+            return
+        try:
+            from watchdog.observers import Observer
+        except ImportError:
+            raise FeatureUnavailable('Config File Watching', 'watchdog')
+        handler = _ConfigFileWatchHandler(
+            [self.INSTANCE_CONFIG_FILE, self.LOCAL_CONFIG_FILE,
+             self.EXTERNAL_CONFIG_SOURCES],
+            self._reload_on_change, debounce
+        )
+        observer = Observer()
+        for directory in handler.directories:
+            if os.path.isdir(directory):
+                observer.schedule(handler, directory, recursive=False)
+        observer.daemon = True
+        observer.start()
+        self._watch_handler = handler
+        self._observer = observer
+
+    def stop_watching(self):
+        """Stop watching the config files for changes.
+
+        :return: None
+        """
+        if self._observer is None:
+            return
+        self._observer.stop()
+        self._observer.join()
+        self._watch_handler.cancel()
+        self._observer = None
+        self._watch_handler = None
 
     @property
     def INSTANCE_CONFIG(self):
@@ -492,11 +990,13 @@ class ConfigManager(object):
         """
         _doc_part = []
         for element in elements:
-            element.ctx = self.__dict__
-            element.ctx['os'] = os
+            element.ctx = self._eval_ctx
+            element.freeze()
             setattr(self, element.name, element.value)
             _doc_part.append(element.doc_render())
+        self._sections.append((list(elements), doc))
         self._docs.append([_doc_part, doc])
+        self._rendered = None
 
     def instance_path(self, path):
         return os.path.join(self.INSTANCE_ROOT, path)
@@ -505,6 +1005,18 @@ class ConfigManager(object):
     def docs(self):
         return self._docs
 
+    def _render(self):
+        if self._rendered is None:
+            rendered = {}
+            for section, name in self._docs:
+                items = {}
+                for oname, doc, default, masked_value, source in section:
+                    items[oname] = {'doc': doc, 'default': default,
+                                    'value': masked_value, 'source': source}
+                rendered[name] = items
+            self._rendered = rendered
+        return self._rendered
+
     def doc_render(self):
         """Returns a dictionary of documentation for the options.
 
@@ -529,17 +1041,14 @@ class ConfigManager(object):
             read, or None if the option was not read from a configuration
             file.
 
+        The rendered dictionary is built once and reused until further
+        elements are loaded or the config files are reloaded. It should
+        not be modified by the caller.
+
         (doc generated mostly by GitHub Copilot)
 
         """
-        rv = {}
-        for section, name in self._docs:
-            items = {}
-            for oname, doc, default, masked_value, source in section:
-                items[oname] = {'doc': doc, 'default': default,
-                                'value': masked_value, 'source': source}
-            rv[name] = items
-        return rv
+        return self._render()
 
     def json_render(self):
         """Render the config as a dict suitable for JSON encoding.
@@ -573,13 +1082,10 @@ class ConfigManager(object):
 
         :returns: a dict of the config.
         """
-        rv = {}
-        for section, name in self._docs:
-            items = {}
-            for oname, doc, default, masked_value, source in section:
-                items[oname] = {'value': masked_value, 'source': source}
-            rv[name] = items
-        return rv
+        return {name: {oname: {'value': item['value'],
+                               'source': item['source']}
+                       for oname, item in items.items()}
+                for name, items in self._render().items()}
 
     def log_render(self):
         """This method logs the rendered configuration. It loops through
@@ -587,13 +1093,18 @@ class ConfigManager(object):
         value of each option, as well as its source (the file in which
         it was defined). The value is masked if the option is sensitive.
 
+        Each section is emitted as a single multi-line log record.
+
         (doc generated mostly by GitHub Copilot)
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
         for section, name in self._docs:
-            logger.info('--------------------------------')
-            logger.info(f"{name.upper()} : ")
-            for oname, _, _, masked_value, source in section:
-                logger.info("    {0:30} :  {1}     ({2})".format(oname, masked_value, source))
+            lines = ['--------------------------------',
+                     f"{name.upper()} : "]
+            lines.extend(f"    {oname:30} :  {masked_value}     ({source})"
+                         for oname, _, _, masked_value, source in section)
+            logger.info('\n'.join(lines))
 
 
 def generate_constants(instance_name):
@@ -614,7 +1125,7 @@ def generate_constants(instance_name):
         ),
         ConfigConstant(
             'INSTANCE_ROOT',
-            "list(filter(os.path.exists, INSTANCE_ROOT_CANDIDATES))[0]",
+            "next(filter(os.path.exists, INSTANCE_ROOT_CANDIDATES), None)",
             "Path to the instance root. Can be redirected if necessary"
             "with a file named ``redirect`` in this folder."
         ),
@@ -665,16 +1176,22 @@ def install_config(manager, instance_name):
     manager.load_elements(config_constants_basic,
                           doc="Tendril Default Instance Root")
 
+    if manager.INSTANCE_ROOT is None:
+        raise InstanceRootNotFoundError(manager.INSTANCE_ROOT_CANDIDATES)
+
     manager.load_elements(config_constants_environment,
                           doc="Environment Variable Override Configuration")
 
-    logger.info("Using Instance Root {}".format(manager.INSTANCE_ROOT))
+    logger.info("Using Instance Root %s", manager.INSTANCE_ROOT)
 
-    if os.path.exists(os.path.join(manager.INSTANCE_ROOT, 'redirect')):
-        logger.info("Found instance redirect")
+    try:
         with open(os.path.join(manager.INSTANCE_ROOT, 'redirect'), 'r') as f:
+            logger.info("Found instance redirect")
             manager.INSTANCE_ROOT = f.read().strip()
-            logger.info("Using Redirected Instance Root {}".format(manager.INSTANCE_ROOT))
+            logger.info("Using Redirected Instance Root %s",
+                        manager.INSTANCE_ROOT)
+    except FileNotFoundError:
+        pass
 
     manager.load_elements(config_constants_redirected,
                           doc="Tendril Configuration Paths")
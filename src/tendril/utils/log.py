@@ -27,6 +27,11 @@ modules.
 At present, this module does nothing that is overly useful, except for
 being able to set the default log level for all modules simultaneously.
 
+Logging is not reconfigured when this module is imported. The interception
+of standard library logging into loguru is installed by :func:`init`,
+which is called on the first use of :func:`get_logger` or
+:func:`apply_config`, and may also be called explicitly.
+
 .. rubric:: Usage Example
 
 >>> from tendril.utils import log
@@ -36,9 +41,12 @@ being able to set the default log level for all modules simultaneously.
 
 import os
 import sys
+import queue
 import socket
 import logging
-from loguru import logger
+import weakref
+import threading
+import traceback
 
 #: Level for debug entries. High volume is ok
 from logging import DEBUG   # noqa
@@ -58,12 +66,42 @@ DEFAULT = logging.INFO
 _hostname = socket.gethostname()
 _rename_modules = False
 _names = {}
+_names_dirty = False
+#: Serialises registering module names with recalculating their short forms,
+#: which happens on whichever thread next logs a record.
+_names_lock = threading.Lock()
 _source_maxlen = 15
 identifier = ''
 
 logger_levels = {}
 loggers = {}
 
+_LOGGING_FILE = logging.__file__
+_getframe = sys._getframe
+
+#: Loguru level names keyed by level number, populated by :func:`init`.
+_LEVEL_BY_NO = {}
+#: loguru loggers bound to the caller depths commonly seen by
+#: :class:`InterceptHandler`, populated by :func:`init`.
+_OPT_CACHE = {}
+
+
+def _get_loguru():
+    """Import loguru on first use and bind its logger into this module.
+
+    loguru is only needed once logging is actually set up, so importing it
+    is deferred to keep it off the import path of scripts which never do.
+    """
+    global logger
+    from loguru import logger
+    return logger
+
+
+def __getattr__(name):
+    if name == 'logger':
+        return _get_loguru()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def _time_fmt(config):
     """
@@ -106,10 +144,11 @@ def _hostname_fmt(config):
     (doc generated mostly by GitHub Copilot)
     """
     if config.LOG_INCLUDE_HOSTNAME:
-        if config.LOG_HOSTNAME_PREFIX:
-            return f' | {_hostname.removeprefix(config.LOG_HOSTNAME_PREFIX)}'
-        else:
-            return f' | {_hostname}'
+        hostname = _hostname
+        prefix = config.LOG_HOSTNAME_PREFIX
+        if prefix and hostname.startswith(prefix):
+            hostname = hostname[len(prefix):]
+        return sys.intern(f' | {hostname}')
     return ''
 
 
@@ -155,19 +194,29 @@ def _config(config):
     return
 
 
+def _logger_levels(levels):
+    name_to_level = logging._nameToLevel
+    return {
+        k: name_to_level.get(v.upper(), v) if isinstance(v, str) else v
+        for k, v in levels.items()
+    }
+
+
 def apply_config(config=None):
     if not config:
         from tendril import config
+    init()
     global DEFAULT
     global identifier
     global logger_levels
-    logger_levels = {k: logging.getLevelName(v) for k, v in config.LOG_LOGGER_LEVELS.items()}
+    logger_levels = _logger_levels(config.LOG_LOGGER_LEVELS)
     DEFAULT = config.LOG_LEVEL
     logging.root.setLevel(config.LOG_LEVEL)
     identifier = _hostname_fmt(config)
+    fmt = _log_fmt(config)
 
-    configure_console_logs(config)
-    create_log_file(config)
+    configure_console_logs(config, fmt=fmt)
+    create_log_file(config, fmt=fmt)
 
 
 def _log_fmt(config):
@@ -177,28 +226,168 @@ def _log_fmt(config):
           "- <level><n>{message}</n></level>"
 
 
-def create_log_file(config):
-    logdir = os.path.split(config.LOG_PATH)[0]
-    if not os.path.exists(logdir):
-        os.makedirs(logdir)
-
-    fmt = _log_fmt(config)
-    logger.add(config.LOG_PATH, level="INFO", serialize=config.JSON_LOGS, enqueue=True,
-               rotation="1 week", retention="14 days", format=fmt,
-               catch=True, backtrace=True, diagnose=True)
+class _QueuedFileSink(object):
+    """A loguru sink which hands formatted messages to a background thread
+    for writing to the log file.
+
+    loguru's own ``enqueue=True`` passes every message through a
+    :class:`multiprocessing.SimpleQueue`, pickling it over a pipe even
+    though the writer lives in the same process. This sink uses a thread
+    queue instead, and leaves rotation and retention to loguru's file sink.
+    Forked children get a fresh queue and writer thread of their own.
+
+    loguru's file sink is not part of its public API, so the import may
+    fail with other versions of loguru. :func:`create_log_file` then falls
+    back to a plain ``enqueue=True`` file sink.
+
+    The queue holds at most ``maxsize`` messages. When it is full, the
+    logging call waits for up to ``timeout`` seconds and then drops the
+    message, or drops it at once if ``timeout`` is 0. Dropped messages are
+    counted and reported by the writer once it has caught up. A ``timeout``
+    of ``None`` blocks the logging call until the writer catches up, and
+    is best reserved for cases where losing messages is worse than
+    stalling the application.
+
+    The writer takes whatever has accumulated in the queue, up to
+    ``batch_max`` messages, writes it into the file's buffer and flushes
+    once per batch rather than once per message. Errors while writing are
+    reported to stderr and do not stop the writer.
+    """
+    encoding = 'utf8'
+    batch_max = 256
+
+    def __init__(self, path, maxsize=0, timeout=1, **kwargs):
+        from loguru._file_sink import FileSink
+        self._sink = FileSink(path, encoding=self.encoding, buffering=-1,
+                              **kwargs)
+        self._maxsize = maxsize
+        self._timeout = timeout
+        self._start()
+        _queued_sinks.add(self)
+
+    def _start(self):
+        self._queue = queue.Queue(maxsize=self._maxsize)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='tendril-log-writer')
+        self._thread.start()
+
+    def write(self, message):
+        try:
+            if self._timeout is None:
+                self._queue.put(message)
+            elif self._timeout > 0:
+                self._queue.put(message, timeout=self._timeout)
+            else:
+                self._queue.put_nowait(message)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def _report_dropped(self):
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        _get_loguru().warning(
+            "Log file writer fell behind, dropped {} messages", dropped)
+
+    @staticmethod
+    def _report_error():
+        if sys.stderr is None:
+            return
+        try:
+            sys.stderr.write("--- Logging error in tendril log writer ---\n")
+            traceback.print_exc(file=sys.stderr)
+            sys.stderr.write("--- End of logging error ---\n")
+        except OSError:
+            pass
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        try:
+            while len(batch) < self.batch_max:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _flush(self):
+        f = getattr(self._sink, '_file', None)
+        if f is not None:
+            f.flush()
+
+    def _run(self):
+        running = True
+        while running:
+            for message in self._next_batch():
+                if message is None:
+                    running = False
+                    break
+                try:
+                    self._sink.write(message)
+                except Exception:
+                    self._report_error()
+            try:
+                self._flush()
+            except Exception:
+                self._report_error()
+            if self._dropped and self._queue.empty():
+                self._report_dropped()
+
+    def stop(self):
+        self._queue.put(None)
+        self._thread.join()
+        self._sink.stop()
+
+
+#: Queued file sinks in this process, whose writers are restarted in
+#: forked children.
+_queued_sinks = weakref.WeakSet()
+
+
+def _restart_queued_sinks():
+    for sink in list(_queued_sinks):
+        sink._start()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_queued_sinks)
+
+
+def create_log_file(config, fmt=None):
+    os.makedirs(os.path.dirname(config.LOG_PATH) or '.', exist_ok=True)
+
+    if fmt is None:
+        fmt = _log_fmt(config)
+    rotation = {'rotation': "1 week", 'retention': "14 days"}
+    try:
+        sink = _QueuedFileSink(config.LOG_PATH,
+                               maxsize=getattr(config, 'LOG_QUEUE_MAX', 10000),
+                               timeout=getattr(config, 'LOG_QUEUE_TIMEOUT', 1),
+                               **rotation)
+        options = {}
+    except ImportError:
+        # loguru's FileSink is private, and this version of loguru does not
+        # have it where _QueuedFileSink expects it.
+        sink = config.LOG_PATH
+        options = dict(rotation, enqueue=True)
+    _get_loguru().add(sink, level="INFO", serialize=config.JSON_LOGS,
+                      format=fmt, catch=True, backtrace=True, diagnose=True,
+                      **options)
     logging.info("Logging to: {}".format(config.LOG_PATH))
 
 
-def configure_console_logs(config):
+def configure_console_logs(config, fmt=None):
     patcher = _config(config)
-    fmt = _log_fmt(config)
+    if fmt is None:
+        fmt = _log_fmt(config)
     params = {
         'handlers': [{"sink": sys.stdout, "serialize": False, "format": fmt,
                       'catch': True, 'backtrace': True, 'diagnose': True}],
     }
     if patcher:
         params['patcher'] = patcher
-    logger.configure(**params)
+    _get_loguru().configure(**params)
 
 
 class InterceptHandler(logging.Handler):
@@ -211,80 +400,128 @@ class InterceptHandler(logging.Handler):
         0: 'NOTSET',
     }
 
-    def emit(self, record):
-        # Get corresponding Loguru level if it exists
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        _get_loguru()
+
+    def _resolve_level(self, record):
         try:
-            level = logger.level(record.levelname).name
+            return logger.level(record.levelname).name
         except AttributeError:
-            level = self.loglevel_mapping[record.levelno]
+            return self.loglevel_mapping[record.levelno]
         except KeyError:
-            level = record.levelno
+            return record.levelno
 
-        # Find caller from where originated the logged message
-        frame, depth = sys._getframe(6), 6
-        while frame and frame.f_code.co_filename == logging.__file__:
+    def emit(self, record):
+        # Get corresponding Loguru level if it exists
+        level = _LEVEL_BY_NO.get(record.levelno)
+        if level is None:
+            level = self._resolve_level(record)
+
+        # Find caller from where originated the logged message. The first
+        # 6 frames are always within logging and this handler.
+        frame, depth = _getframe(6), 6
+        logging_file = _LOGGING_FILE
+        while frame and frame.f_code.co_filename == logging_file:
             frame = frame.f_back
             depth += 1
 
-        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+        if record.exc_info:
+            opt = logger.opt(depth=depth, exception=record.exc_info)
+        else:
+            opt = _OPT_CACHE.get(depth) or logger.opt(depth=depth)
+        opt.log(level, record.getMessage())
+
+
+#: External loggers which are too noisy at the default level, and are
+#: restricted to WARNING and above.
+_SILENCED_LOGGERS = (
+    'watchdog.observers.inotify_buffer',
+    'requests.packages.urllib3.connectionpool',
+    'passlib.registry',
+    'passlib.utils.compat',
+    'appenlight_client.utils',
+    'appenlight_client.timing',
+    'appenlight_client.client',
+    'appenlight_client.transports.requests',
+    'pika.callback',
+    'pika.channel',
+    'pika.heartbeat',
+    'pika.connection',
+    'pika.adapters.base_connection',
+    'pika.adapters.blocking_connection',
+    'pika.adapters.select_connection',
+    'urllib3.connectionpool',
+    'matplotlib',
+    'matplotlib.font_manager',
+    'matplotlib.backends',
+    'parso.python.diff',
+    'parso.cache',
+    'grafana_client.api',
+)
+
+_initialized = False
+
+
+def init(force=False):
+    """Route standard library logging into loguru.
+
+    This only installs the :class:`InterceptHandler`. loguru's own sinks
+    are configured by :func:`apply_config`.
+
+    This takes over stdlib logging for the whole process. The root logger's
+    handlers are replaced, and other loggers lose their handlers and
+    propagate to it. Since :class:`InterceptHandler` locates the caller
+    itself, the stdlib's own caller lookup is also disabled, so records
+    seen by any other stdlib handler or filter carry no source file,
+    line or function.
+    """
+    global _initialized
+    if _initialized and not force:
+        return
 
+    # the caller is located by InterceptHandler itself, so the stdlib
+    # need not walk the stack to fill in the source of each record
+    logging._srcfile = None
 
-def init():
     # intercept everything at the root logger
     logging.root.handlers = [InterceptHandler()]
     logging.root.setLevel(logging.INFO)
 
     # remove every other logger's handlers
     # and propagate to root logger
-    for name in logging.root.manager.loggerDict.keys():
-        logging.getLogger(name).handlers = []
-        logging.getLogger(name).propagate = True
-
-    # bootstrap loguru
-    logger.configure(handlers=[{"sink": sys.stdout, "serialize": False}])
+    for name in list(logging.root.manager.loggerDict):
+        external_logger = logging.getLogger(name)
+        external_logger.handlers = []
+        external_logger.propagate = True
+
+    # loguru's sinks are left alone here, so that any the application has
+    # already added survive. They are set up by apply_config.
+    logger = _get_loguru()
+    _LEVEL_BY_NO.clear()
+    _LEVEL_BY_NO.update({lvl.no: lvl.name
+                         for lvl in logger._core.levels.values()})
+    _OPT_CACHE.clear()
+    _OPT_CACHE.update({depth: logger.opt(depth=depth)
+                       for depth in range(6, 20)})
 
     # logging.basicConfig(level=logging.DEBUG)
-    silence = [
-        logging.getLogger('watchdog.observers.inotify_buffer'),
-        logging.getLogger('requests.packages.urllib3.connectionpool'),
-        logging.getLogger('passlib.registry'),
-        logging.getLogger('passlib.utils.compat'),
-        logging.getLogger('appenlight_client.utils'),
-        logging.getLogger('appenlight_client.timing'),
-        logging.getLogger('appenlight_client.client'),
-        logging.getLogger('appenlight_client.transports.requests'),
-        logging.getLogger('pika.callback'),
-        logging.getLogger('pika.channel'),
-        logging.getLogger('pika.heartbeat'),
-        logging.getLogger('pika.connection'),
-        logging.getLogger('pika.adapters.base_connection'),
-        logging.getLogger('pika.adapters.blocking_connection'),
-        logging.getLogger('pika.adapters.select_connection'),
-        logging.getLogger('urllib3.connectionpool'),
-        logging.getLogger('matplotlib'),
-        logging.getLogger('matplotlib.font_manager'),
-        logging.getLogger('matplotlib.backends'),
-        logging.getLogger('parso.python.diff'),
-        logging.getLogger('parso.cache'),
-        logging.getLogger('grafana_client.api')
-    ]
-    for external_logger in silence:
-        external_logger.setLevel(logging.WARNING)
+    for name in _SILENCED_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
     logging.getLogger('pika.connection').setLevel(logging.ERROR)
+    _initialized = True
 
 
 def _shortname(name, extra):
+    if _names_dirty:
+        _ensure_names()
     extra["name"] = _names.get(name, name)
 
 
 _std_abbreviate = {'tendril': 't', 'libraries': 'lib'}
-_never_abbreviate = ['db', 'config', 'mq']
-_never_abbreviate_before = []
-_never_abbreviate_after = []
-
-
-def _tlen(parts):
-    return sum([len(x) for x in parts]) + len(parts) - 1
+_never_abbreviate = frozenset(['db', 'config', 'mq'])
+_never_abbreviate_before = frozenset()
+_never_abbreviate_after = frozenset()
 
 
 def _recalculate_names():
@@ -311,31 +548,39 @@ def _recalculate_names():
     (doc generated mostly by GitHub Copilot)""" 
     global _names
     maxlen = _source_maxlen
+    names = list(_names)
     tokens = {}
-    for name in _names.keys():
+    for name in names:
         parts = name.split('.')[:-1]
         for part in parts:
             current = tokens.get(part, {'abbrev': part, 'count': 0})
             current['count'] = current['count'] + 1
             tokens[part] = current
+    # Abbreviations already handed out, and tokens not yet abbreviated,
+    # which continue to hold their own full names.
+    used_abbrevs = set(_std_abbreviate.values())
+    pending = set(tokens)
     for token in sorted(tokens.keys(), key=lambda x: tokens[x]['count'], reverse=True):
-        if token in _std_abbreviate.keys():
-            tokens[token]['abbrev'] = _std_abbreviate[token]
-            done = True
+        pending.discard(token)
+        if token in _std_abbreviate:
+            abbrev = _std_abbreviate[token]
         elif token in _never_abbreviate:
-            tokens[token]['abbrev'] = token
-            done = True
+            abbrev = token
         else:
-            done = False
-        alen = 0
-        while not done:
-            alen = alen + 1
-            abbrev = token[:alen]
-            if abbrev not in [tokens[x]['abbrev'] for x in tokens.keys()]:
-                tokens[token]['abbrev'] = abbrev
-                done = True
-    for name in _names.keys():
+            alen = 0
+            while True:
+                alen = alen + 1
+                abbrev = token[:alen]
+                if alen >= len(token):
+                    break
+                if abbrev not in used_abbrevs and abbrev not in pending:
+                    break
+        tokens[token]['abbrev'] = abbrev
+        used_abbrevs.add(abbrev)
+    short_names = {}
+    for name in names:
         parts = name.split('.')
+        total_len = len(name)
         for idx, part in enumerate(parts[:-1]):
             if part in _never_abbreviate:
                 continue
@@ -349,19 +594,36 @@ def _recalculate_names():
                     continue
             except IndexError:
                 pass
-            if _tlen(parts) > maxlen:
+            if total_len > maxlen:
                 parts[idx] = tokens[part]['abbrev'] + '.'
+                total_len -= len(part) - len(parts[idx])
             else:
                 break
-        _names[name] = '.'.join(parts)
+        short_names[name] = sys.intern('.'.join(parts))
+    _names = short_names
 
 
 def _register_name(name):
     global _names
-    _names[name] = name
+    global _names_dirty
+    name = sys.intern(name)
+    with _names_lock:
+        _names[name] = name
+        _names_dirty = True
+
+
+def _ensure_names():
+    """Recalculate the shortened module names if any have been registered
+    since they were last calculated. This is deferred to the first log record
+    which needs them, instead of being done for every new logger."""
+    global _names_dirty
     if not _rename_modules:
         return
-    _recalculate_names()
+    with _names_lock:
+        if not _names_dirty:
+            return
+        _names_dirty = False
+        _recalculate_names()
 
 
 def get_logger(name, level=None):
@@ -382,23 +644,26 @@ def get_logger(name, level=None):
     :return: The logger instance
     """
     global loggers
-    if name in loggers.keys():
-        return loggers[name]
+    cached = loggers.get(name)
+    if cached is not None:
+        return cached
+    if not _initialized:
+        init()
     built_logger = logging.getLogger(name)
     if level is not None:
         built_logger.setLevel(level)
-    elif name in logger_levels.keys():
+    elif name in logger_levels:
         built_logger.setLevel(logger_levels[name])
     else:
         built_logger.setLevel(DEFAULT)
-    if name not in _names.keys():
+    if name not in _names:
         _register_name(name)
     loggers[name] = built_logger
     return built_logger
 
 
 def set_logger_level(name, level):
-    if name not in loggers.keys():
+    if name not in loggers:
         return
     if isinstance(level, str):
         level = logging.getLevelName(level)
@@ -410,5 +675,3 @@ def known_loggers():
 
 
 getLogger = get_logger
-
-init()
@@ -2,16 +2,24 @@
 
 
 from pydantic import BaseModel
+from pydantic import VERSION as PYDANTIC_VERSION
 
 
-class TendrilTBaseModel(BaseModel):
-    class Config:
-        allow_population_by_field_name = True
+if PYDANTIC_VERSION.startswith('1.'):
+    class TendrilTBaseModel(BaseModel):
+        class Config:
+            allow_population_by_field_name = True
 
+    class TendrilTORMModel(BaseModel):
+        class Config:
+            allow_population_by_field_name = True
+            orm_mode = True
 
-class TendrilTORMModel(BaseModel):
-    class Config:
-        allow_population_by_field_name = True
-        orm_mode = True
+else:
+    from pydantic import ConfigDict
 
+    class TendrilTBaseModel(BaseModel):
+        model_config = ConfigDict(populate_by_name=True)
 
+    class TendrilTORMModel(BaseModel):
+        model_config = ConfigDict(populate_by_name=True, from_attributes=True)
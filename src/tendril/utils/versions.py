@@ -32,7 +32,9 @@ TODO Describe Architecture and Usage somewhere
 from __future__ import print_function
 
 import os
+import sys
 import rich
+import functools
 import pkg_resources
 import pkgutil
 import importlib
@@ -45,6 +47,24 @@ def get_namespace_package_names(namespace):
         yield name
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_namespace_package_names(namespace, sys_path):
+    return tuple(get_namespace_package_names(namespace))
+
+
+def get_cached_namespace_package_names(namespace):
+    """Return a tuple of the names of the packages within the namespace,
+    as from :func:`get_namespace_package_names`. The result is cached
+    per namespace and is discarded if ``sys.path`` changes. Use
+    :func:`clear_namespace_cache` to discard it explicitly.
+    """
+    return _cached_namespace_package_names(namespace, tuple(sys.path))
+
+
+def clear_namespace_cache():
+    _cached_namespace_package_names.cache_clear()
+
+
 def _namespace_primary_location(namespace, fpath):
     while os.path.split(fpath)[1] != namespace.split('.')[-1]:
         fpath = os.path.split(fpath)[0]
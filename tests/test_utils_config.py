@@ -0,0 +1,413 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# Copyright (C) 2015 Chintalagiri Shashank
+#
+# This file is part of tendril.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Docstring for test_utils_config
+"""
+
+import os
+import json
+import sys
+import marshal
+import importlib.util
+import logging
+import textwrap
+import time
+
+import pytest
+
+from tendril.utils import config
+from tendril.utils.versions import clear_namespace_cache
+
+
+INSTANCE_NAME = 'tinst'
+
+MODULES = {
+    'core': """
+        from tendril.utils.config import install_config
+        depends = []
+        def load(m):
+            install_config(m, {instance!r})
+    """,
+    'b': """
+        from tendril.utils.config import ConfigOption
+        depends = ['{prefix}.core']
+        def load(m):
+            m.load_elements([ConfigOption('B_OPT', "INSTANCE_NAME + '-b'",
+                                          'b doc')], doc='B')
+    """,
+    'a': """
+        from tendril.utils.config import ConfigConstant
+        from tendril.utils.config import ConfigOption
+        depends = ['{prefix}.b']
+        def load(m):
+            m.load_elements([
+                ConfigOption('A_OPT', "B_OPT + '-a'", 'a doc'),
+                ConfigOption('DATA_ROOT', "'/data'", 'data root'),
+                ConfigConstant('DATA_SUB', "os.path.join(DATA_ROOT, 'sub')",
+                               'data sub'),
+                ConfigOption('DATA_SUB2', "os.path.join(DATA_SUB, '2')",
+                             'data sub2'),
+            ], doc='A')
+    """,
+    'cyc1': """
+        depends = ['{prefix}.cyc2']
+        def load(m):
+            raise RuntimeError
+    """,
+    'cyc2': """
+        depends = ['{prefix}.cyc1']
+        def load(m):
+            raise RuntimeError
+    """,
+    'orphan': """
+        depends = ['{prefix}.missing']
+        def load(m):
+            raise RuntimeError
+    """,
+}
+
+
+@pytest.fixture
+def instance_root(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    root = tmp_path / '.{}'.format(INSTANCE_NAME) / 'tendril'
+    root.mkdir(parents=True)
+    return root
+
+
+@pytest.fixture
+def manager_factory(tmp_path, monkeypatch, instance_root):
+    prefix = 'tcfg_{}'.format(abs(hash(str(tmp_path))))
+    package = tmp_path / 'nspkg' / prefix
+    package.mkdir(parents=True)
+    (package / '__init__.py').write_text(
+        "__path__ = __import__('pkgutil').extend_path(__path__, __name__)\n")
+    for name, source in MODULES.items():
+        (package / '{}.py'.format(name)).write_text(textwrap.dedent(
+            source.format(prefix=prefix, instance=INSTANCE_NAME)))
+    monkeypatch.syspath_prepend(str(tmp_path / 'nspkg'))
+    clear_namespace_cache()
+
+    yield lambda **kwargs: config.ConfigManager(prefix, None, [], **kwargs)
+
+    clear_namespace_cache()
+    for name in [x for x in sys.modules if x.split('.')[0] == prefix]:
+        del sys.modules[name]
+
+
+def test_load_order(manager_factory, caplog):
+    with caplog.at_level(logging.ERROR, logger=config.__name__):
+        manager = manager_factory()
+    prefix = manager._prefix
+    assert manager._modules_loaded == ['{}.core'.format(prefix),
+                                       '{}.b'.format(prefix),
+                                       '{}.a'.format(prefix)]
+    assert manager.A_OPT == 'tinst-b-a'
+
+    failures = [r.getMessage() for r in caplog.records
+                if r.getMessage().startswith('Failed loading')]
+    assert len(failures) == 3
+    assert 'Failed loading {0}.orphan. Missing dependency : {0}.missing'\
+        .format(prefix) in failures
+    assert 'Failed loading {0}.cyc1. Missing dependency : {0}.cyc2'\
+        .format(prefix) in failures
+
+
+def test_config_cache(instance_root, tmp_path):
+    path = instance_root / 'instance_config.py'
+    path.write_text('A = 41\n')
+    st = os.stat(path)
+    assert config._exec_config(str(path), cache=True)['A'] == 41
+    cache_files = list((tmp_path / 'cache').rglob('*.pyc'))
+    assert len(cache_files) == 1
+
+    # Same size and mtime, different contents
+    path.write_text('A = 42\n')
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert config._exec_config(str(path), cache=True)['A'] == 42
+
+    # The cached code is used while the cache is private to this user,
+    # and ignored once anyone else can write to it.
+    cache_file = cache_files[0]
+    header = importlib.util.MAGIC_NUMBER + \
+        importlib.util.source_hash(path.read_bytes())
+    cache_file.write_bytes(
+        header + marshal.dumps(compile('A = 0', str(path), 'exec')))
+    assert config._exec_config(str(path), cache=True)['A'] == 0
+    os.chmod(cache_file.parent, 0o777)
+    assert config._exec_config(str(path), cache=True)['A'] == 42
+    os.chmod(cache_file.parent, 0o700)
+
+
+def test_config_cache_disabled(instance_root, tmp_path):
+    path = instance_root / 'instance_config.py'
+    path.write_text('A = 41\n')
+    assert config._exec_config(str(path))['A'] == 41
+    assert not (tmp_path / 'cache').exists()
+
+
+JSON_DOCUMENT = {
+    'a': {'b': 8, 'c': {'d': [1, {'e': 2}]}},
+    'a.b': 7,
+    'l': [1, 2, 3],
+    'item': {'x': 1},
+    'f': 1.5,
+    'n': None,
+}
+
+JSON_KEYS = ['a:b', 'a.b', 'l', 'l:item', 'item:x', 'a:c', 'a:c:d:e',
+             'f', 'n', 'zz']
+
+
+def _extract_all(path, keys, stream):
+    config._EXTERNAL_JSON_CACHE.clear()
+    keymap = {'K{}'.format(idx): key for idx, key in enumerate(keys)}
+    source = config.ConfigExternalJSONSource(str(path), keymap,
+                                             stream=stream)
+    rval = {}
+    for name, key in keymap.items():
+        try:
+            rval[key] = source.get(name)
+        except config.ExternalConfigKeyError:
+            rval[key] = 'MISSING'
+    return rval
+
+
+def test_json_extraction_parity(tmp_path):
+    pytest.importorskip('ijson')
+    path = tmp_path / 'source.json'
+    path.write_text(json.dumps(JSON_DOCUMENT))
+
+    streamed = _extract_all(path, JSON_KEYS, stream=True)
+    loaded = _extract_all(path, JSON_KEYS, stream=False)
+
+    assert streamed == loaded
+    assert loaded['a:b'] == 8
+    assert loaded['a.b'] == 7
+    assert loaded['l'] == [1, 2, 3]
+    assert loaded['l:item'] == 'MISSING'
+    assert loaded['a:c'] == {'d': [1, {'e': 2}]}
+    assert loaded['a:c:d:e'] == 'MISSING'
+
+
+def test_json_duplicate_keys(tmp_path):
+    pytest.importorskip('ijson')
+    path = tmp_path / 'source.json'
+    path.write_text('{"a": {"b": 1}, "a": {"c": 2}}')
+    keys = ['a:b', 'a:c']
+    assert _extract_all(path, keys, stream=False) == \
+        {'a:b': 'MISSING', 'a:c': 2}
+    assert _extract_all(path, keys, stream=True) == {'a:b': 1, 'a:c': 2}
+
+
+def test_json_stream_unavailable(monkeypatch):
+    monkeypatch.setattr(config, 'ijson', None)
+    with pytest.raises(config.FeatureUnavailable):
+        config.ConfigExternalJSONSource('source.json', {}, stream=True)
+
+
+def test_reload(manager_factory, instance_root):
+    instance_config = instance_root / 'instance_config.py'
+    instance_config.write_text("B_OPT = 'first'\n")
+    manager = manager_factory()
+    assert manager.B_OPT == 'first'
+    assert manager.A_OPT == 'first-a'
+    assert manager.DATA_SUB2 == '/data/sub/2'
+
+    instance_config.write_text("B_OPT = 'second'\n"
+                               "DATA_ROOT = '/other'\n")
+    manager.reload_config_files()
+    assert manager.B_OPT == 'second'
+    assert manager.A_OPT == 'second-a'
+    assert manager.DATA_SUB == '/other/sub'
+    assert manager.DATA_SUB2 == '/other/sub/2'
+    assert manager.doc_render()['B']['B_OPT']['source'] == 'instance_config'
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return predicate()
+
+
+def test_watching(manager_factory, instance_root):
+    pytest.importorskip('watchdog')
+    instance_config = instance_root / 'instance_config.py'
+    instance_config.write_text("B_OPT = 'first'\n")
+    manager = manager_factory()
+    manager.start_watching(debounce=0.05)
+    try:
+        observer = manager._observer
+        manager.start_watching()
+        assert manager._observer is observer
+        instance_config.write_text("B_OPT = 'second'\n")
+        assert _wait_for(lambda: manager.A_OPT == 'second-a')
+    finally:
+        manager.stop_watching()
+    assert manager._observer is None
+    assert not observer.is_alive()
+
+    instance_config.write_text("B_OPT = 'third'\n")
+    time.sleep(0.3)
+    assert manager.B_OPT == 'second'
+    manager.stop_watching()
+
+
+def test_watching_unavailable(manager_factory, monkeypatch):
+    manager = manager_factory()
+    monkeypatch.setitem(sys.modules, 'watchdog.observers', None)
+    with pytest.raises(config.FeatureUnavailable):
+        manager.start_watching()
+    assert manager._observer is None
+
+
+def test_external_sources_fall_through(tmp_path):
+    (tmp_path / '1.json').write_text(json.dumps({'a': 1}))
+    (tmp_path / '2.json').write_text(json.dumps({'a': 9, 'b': 2}))
+    (tmp_path / 'map.yaml').write_text(textwrap.dedent("""
+        - {{format: json, path: {0}/none.json, keymap: {{A: 'a'}}}}
+        - {{format: json, path: {0}/1.json, keymap: {{A: 'a', B: 'b'}}}}
+        - {{format: json, path: {0}/2.json, keymap: {{A: 'a', B: 'b'}}}}
+    """).format(tmp_path))
+    config._EXTERNAL_JSON_CACHE.clear()
+    sources = config.ConfigExternalSources(str(tmp_path / 'map.yaml'))
+    assert sources.get('A') == 1
+    assert sources.get('B') == 2
+    with pytest.raises(config.ExternalConfigKeyError):
+        sources.get('C')
+
+
+def test_import_workers(manager_factory, caplog):
+    with caplog.at_level(logging.ERROR, logger=config.__name__):
+        manager = manager_factory(import_workers=4)
+    prefix = manager._prefix
+    assert manager._modules_loaded == ['{}.core'.format(prefix),
+                                       '{}.b'.format(prefix),
+                                       '{}.a'.format(prefix)]
+    assert manager.A_OPT == 'tinst-b-a'
+    assert len([r for r in caplog.records
+                if r.getMessage().startswith('Failed loading')]) == 3
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('a', True),
+    (1, True),
+    (1.5, True),
+    (True, True),
+    (None, True),
+    ([1, 'a', None], True),
+    ((1, [2, {'a': 3}]), True),
+    ({'a': [1, 2], 1: None}, True),
+    ({(1, 2): 1}, False),
+    ({'a': {1, 2}}, False),
+    ([1, object()], False),
+    (b'a', False),
+])
+def test_is_jsonable(value, expected):
+    assert config.is_jsonable(value) is expected
+
+
+def test_is_jsonable_circular():
+    value = [1]
+    value.append(value)
+    assert config.is_jsonable(value) is False
+    value = {}
+    value['a'] = value
+    assert config.is_jsonable(value) is False
+
+
+def test_external_json_cache(tmp_path):
+    path = tmp_path / 'source.json'
+    path.write_text(json.dumps({'a': {'b': [1]}}))
+    config._EXTERNAL_JSON_CACHE.clear()
+    keymap = {'A': 'a'}
+
+    value = config.ConfigExternalJSONSource(str(path), keymap).get('A')
+    assert value == {'b': [1]}
+    assert len(config._EXTERNAL_JSON_CACHE) == 1
+
+    # Values are copied out of the cache shared between sources
+    value['b'].append(2)
+    source = config.ConfigExternalJSONSource(str(path), keymap)
+    assert source.get('A') == {'b': [1]}
+    assert source.get('A') is not source.get('A')
+
+    # and the cache is discarded when the file changes
+    st = os.stat(path)
+    path.write_text(json.dumps({'a': {'b': [1, 2, 3]}}))
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    source = config.ConfigExternalJSONSource(str(path), keymap)
+    assert source.get('A') == {'b': [1, 2, 3]}
+    assert len(config._EXTERNAL_JSON_CACHE) == 1
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('', '...'),
+    ('secret', '...'),
+    ('0123456', '...'),
+    ('01234567', '0...7'),
+    ('0123456789abcdef', '01...ef'),
+    ('x' * 200, 'xxxxxxxx...xxxxxxxx'),
+    (1234, 1234),
+])
+def test_masked_value(value, expected):
+    option = config.ConfigOption('MASKED', repr(value), 'doc', masked=True)
+    option.ctx = {'_environment_overrides': {}, '_local_config': {},
+                  '_instance_config': {}, '_external_configs': None}
+    assert option.masked_value == expected
+    option.freeze()
+    assert option.masked_value == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    (True, True),
+    (False, False),
+    (None, False),
+    (0, False),
+    (1, True),
+    ('', False),
+    ('yes', True),
+    (' True ', True),
+    ('ON', True),
+    ('1', True),
+    ('no', False),
+    ('False', False),
+    ('off', False),
+    ('0', False),
+])
+def test_bool_parser(value, expected):
+    assert config.bool_parser(value) is expected
+
+
+def test_bool_parser_invalid():
+    with pytest.raises(ValueError):
+        config.bool_parser('maybe')
+
+
+def test_is_jsonable_deep():
+    value = []
+    for _ in range(5000):
+        value = [value]
+    assert config.is_jsonable(value) is False
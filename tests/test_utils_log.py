@@ -24,6 +24,7 @@ Docstring for test_utils_log
 
 from tendril.utils import log
 import logging
+import sys
 
 
 def test_log_default():
@@ -61,3 +62,115 @@ def test_log_other():
     logger = log.get_logger("Debug_Logger", log.DEBUG)
     assert logger.name == "Debug_Logger"
     assert logger.level == logging.DEBUG
+
+
+def test_init_keeps_loguru_sinks():
+    seen = []
+    sink_id = log.logger.add(seen.append, format="{message}")
+    try:
+        log.get_logger("Sink_Logger")
+        log.init(force=True)
+        log.logger.info("after")
+        logging.getLogger("Sink_Logger").warning("intercepted")
+    finally:
+        log.logger.remove(sink_id)
+    assert [str(x).strip() for x in seen] == ["after", "intercepted"]
+
+
+def test_shortnames_single_character_token(monkeypatch):
+    monkeypatch.setattr(log, '_names', {})
+    monkeypatch.setattr(log, '_rename_modules', True)
+    monkeypatch.setattr(log, '_source_maxlen', 5)
+    for name in ['x.mod', 'x.y.mod', 'xy.z.mod']:
+        log._register_name(name)
+    log._ensure_names()
+    assert log._names['x.mod'] == 'x.mod'
+    assert log._names['x.y.mod'] == 'x..y..mod'
+    assert log._names['xy.z.mod'] == 'xy..z..mod'
+
+
+def test_queued_file_sink(tmp_path):
+    import re
+    import threading
+    from loguru import logger as loguru_logger
+
+    path = tmp_path / 'queued.log'
+    sink = log._QueuedFileSink(str(path), maxsize=2, timeout=0)
+    release = threading.Event()
+    write = sink._sink.write
+
+    def stalled_write(message):
+        release.wait()
+        write(message)
+
+    sink._sink.write = stalled_write
+    handler_id = loguru_logger.add(sink, format='{message}')
+    try:
+        for idx in range(10):
+            loguru_logger.info('message {}', idx)
+        release.set()
+        # Written and flushed without the sink being stopped
+        for _ in range(100):
+            content = path.read_text() if path.exists() else ''
+            if 'dropped' in content:
+                break
+            threading.Event().wait(0.05)
+    finally:
+        loguru_logger.remove(handler_id)
+
+    written = re.findall(r'^message \d+$', content, re.MULTILINE)
+    dropped = re.search(r'dropped (\d+) messages', content)
+    assert dropped is not None
+    assert int(dropped.group(1)) > 0
+    assert len(written) + int(dropped.group(1)) == 10
+
+
+class _LogConfig(object):
+    JSON_LOGS = False
+
+    def __init__(self, path):
+        self.LOG_PATH = str(path)
+
+
+def _create_log_file(path):
+    from loguru import logger as loguru_logger
+    before = set(loguru_logger._core.handlers)
+    log.create_log_file(_LogConfig(path), fmt='{message}')
+    handler_id, = set(loguru_logger._core.handlers) - before
+    return handler_id
+
+
+def test_create_log_file(tmp_path):
+    from loguru import logger as loguru_logger
+    path = tmp_path / 'logs' / 'tendril.log'
+    handler_id = _create_log_file(path)
+    loguru_logger.info('queued')
+    loguru_logger.remove(handler_id)
+    assert path.read_text().endswith('\nqueued\n')
+
+
+def test_create_log_file_fallback(tmp_path, monkeypatch):
+    from loguru import logger as loguru_logger
+    monkeypatch.setitem(sys.modules, 'loguru._file_sink', None)
+    path = tmp_path / 'logs' / 'tendril.log'
+    handler_id = _create_log_file(path)
+    loguru_logger.info('enqueued')
+    loguru_logger.remove(handler_id)
+    assert path.read_text().endswith('\nenqueued\n')
+
+
+def test_logger_levels():
+    levels = log._logger_levels({
+        'a': 'DEBUG',
+        'b': 'warning',
+        'c': 10,
+        'd': logging.ERROR,
+        'e': 'CUSTOM',
+    })
+    assert levels == {
+        'a': logging.DEBUG,
+        'b': logging.WARNING,
+        'c': 10,
+        'd': logging.ERROR,
+        'e': 'CUSTOM',
+    }